@@ -2,10 +2,16 @@
 Keyword Scraper - Simple & Clean
 """
 
-import sys, asyncio, aiohttp, time, random
+import sys, os, asyncio, aiohttp, orjson, time, random
+from aiohttp.resolver import AsyncResolver
+from aiolimiter import AsyncLimiter
 from datetime import datetime
 from typing import List, Set, Optional
-import re
+import re, csv
+from collections import defaultdict
+from concurrent.futures import Future
+from operator import itemgetter
+from urllib.parse import urlsplit
 
 try:
     from PySide6.QtWidgets import *
@@ -15,9 +21,91 @@ except ImportError:
     print("pip install PySide6")
     sys.exit(1)
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
-class ProxyManager:
+
+_EXPANSION = tuple('abcdefghijklmnopqrstuvwxyz0123456789')
+
+# ip:port | user:pass@ip:port | http(s)://ip:port
+_PROXY_RE = re.compile(r'(?:[^:]+:[^@]+@|https?://)?(?:\d{1,3}\.){3}\d{1,3}:\d+\Z')
+
+
+# indexed by whole seconds: <1s FAST, <3s GOOD, otherwise OK
+_SPEED_LABELS = ("FAST", "GOOD", "GOOD", "OK")
+
+
+def _label(rt: float) -> str:
+    return _SPEED_LABELS[min(int(rt), 3)]
+
+
+def _throttled(progress_cb, interval: float = 0.05):
+    last_pct, last_ts = -1, 0.0
+
+    def report(done: int, total: int):
+        nonlocal last_pct, last_ts
+        pct = done * 100 // total
+        now = time.monotonic()
+        if pct != last_pct and (now - last_ts > interval or pct == 100):
+            progress_cb(pct)
+            last_pct, last_ts = pct, now
+
+    return report
+
+
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    return uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+
+
+def _accept(s: str) -> Optional[str]:
+    if not isinstance(s, str):
+        return None
+    s = s.strip()
+    return s if 2 <= len(s) <= 100 else None
+
+
+class AppSession:
     def __init__(self):
+        self._sessions = {}
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, *_):
+        await self.close()
+
+    async def open(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            try:
+                resolver = AsyncResolver()
+            except Exception:
+                resolver = None
+            connector = aiohttp.TCPConnector(
+                limit=0, limit_per_host=50, resolver=resolver,
+                use_dns_cache=True, ttl_dns_cache=300, enable_cleanup_closed=True, keepalive_timeout=60, force_close=False
+            )
+            session = aiohttp.ClientSession(
+                connector=connector,
+                headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+            )
+            self._sessions[loop] = session
+        return session
+
+    async def close(self):
+        session = self._sessions.pop(asyncio.get_running_loop(), None)
+        if session and not session.closed:
+            await session.close()
+
+
+class ProxyManager:
+    def __init__(self, app_session: Optional[AppSession] = None):
+        self._owns_session = app_session is None
+        self.app_session = app_session or AppSession()
         self.working_proxies = []
         self.failed_proxies = []
         self.rotation_count = 0
@@ -29,12 +117,7 @@ class ProxyManager:
         self.timeout = timeout
 
     def validate_proxy_format(self, proxy: str) -> bool:
-        patterns = [
-            r'^(\d{1,3}\.){3}\d{1,3}:\d+$',
-            r'^[^:]+:[^@]+@(\d{1,3}\.){3}\d{1,3}:\d+$',
-            r'^https?://(\d{1,3}\.){3}\d{1,3}:\d+$'
-        ]
-        return any(re.match(pattern, proxy) for pattern in patterns)
+        return _PROXY_RE.match(proxy) is not None
 
     async def test_single_proxy(self, session: aiohttp.ClientSession, proxy: str) -> Optional[dict]:
         if not proxy.startswith(('http://', 'https://')):
@@ -43,8 +126,9 @@ class ProxyManager:
             proxy_url = proxy
         try:
             start = time.time()
-            async with session.get("http://httpbin.org/ip", proxy=proxy_url) as r:
-                if r.status == 200:
+            timeout = aiohttp.ClientTimeout(total=self.timeout)
+            async with session.head("http://www.gstatic.com/generate_204", proxy=proxy_url, timeout=timeout, allow_redirects=False) as r:
+                if r.status == 204:
                     return {'proxy': proxy, 'response_time': time.time()-start}
         except Exception:
             pass
@@ -56,29 +140,37 @@ class ProxyManager:
             return 0, 0
 
         if self.speed == "fast":
-            conn_limit, per_host = 200, 100
+            conn_limit = 200
         elif self.speed == "medium":
-            conn_limit, per_host = 100, 50
+            conn_limit = 100
         else:
-            conn_limit, per_host = 50, 25
+            conn_limit = 50
 
-        connector = aiohttp.TCPConnector(limit=conn_limit, limit_per_host=per_host)
-        timeout = aiohttp.ClientTimeout(total=self.timeout)
         working, failed = [], []
         done, total = 0, len(valid_input)
 
-        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
-            tasks = [asyncio.create_task(self.test_single_proxy(session, p)) for p in valid_input]
-            for t in asyncio.as_completed(tasks):
-                res = await t
+        pending = iter(valid_input)
+        session = await self.app_session.open()
+        report = _throttled(progress_cb) if progress_cb else None
+
+        async def worker():
+            nonlocal done
+            for p in pending:
+                res = await self.test_single_proxy(session, p)
                 if res:
                     working.append(res)
+                else:
+                    failed.append({'proxy': p})
                 done += 1
-                if progress_cb:
-                    progress_cb(int(done*100/total))
+                if report:
+                    report(done, total)
 
-        worked_set = {w['proxy'] for w in working}
-        failed = [{'proxy': p} for p in valid_input if p not in worked_set]
+        try:
+            workers = [asyncio.create_task(worker()) for _ in range(min(conn_limit, total))]
+            await asyncio.gather(*workers)
+        finally:
+            if self._owns_session:
+                await self.app_session.close()
 
         self.working_proxies = working
         self.failed_proxies = failed
@@ -93,151 +185,160 @@ class ProxyManager:
 
 
 class EnhancedKeywordScraper:
-    def __init__(self, max_concurrent=30, timeout=8, proxy_manager=None, enabled_engines=None):
+    def __init__(self, max_concurrent=30, timeout=8, proxy_manager=None, enabled_engines=None, per_host_limit=20, max_retries=3, app_session=None):
         self.max_concurrent = max_concurrent
+        self.per_host_limit = per_host_limit
+        self.max_retries = max_retries
         self.timeout = aiohttp.ClientTimeout(total=timeout)
         self.proxy_manager = proxy_manager
         self.enabled_engines = enabled_engines or {}
+        self._owns_session = app_session is None
+        self.app_session = app_session or AppSession()
         self.session = None
 
     async def __aenter__(self):
-        connector = aiohttp.TCPConnector(limit=200, limit_per_host=60)
-        self.session = aiohttp.ClientSession(
-            connector=connector,
-            timeout=self.timeout,
-            headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-        )
+        self.session = await self.app_session.open()
+        self._cache = {}
+        self._cache_ttl = 600
+        self._host_sem = defaultdict(lambda: asyncio.Semaphore(self.per_host_limit))
+        self._host_limiter = defaultdict(lambda: AsyncLimiter(10, 1), {
+            'suggestqueries.google.com': AsyncLimiter(10, 1),
+            'api.bing.com': AsyncLimiter(7, 1),
+            'duckduckgo.com': AsyncLimiter(5, 1),
+        })
         return self
 
     async def __aexit__(self, *_):
-        if self.session:
-            await self.session.close()
+        if self._owns_session:
+            await self.app_session.close()
 
     async def _get(self, url, params):
-        proxy = self.proxy_manager.get_random_proxy() if self.proxy_manager else None
+        key = (url, tuple(sorted(params.items())))
+        now = time.time()
+        hit = self._cache.get(key)
+        if hit and now - hit[0] < self._cache_ttl:
+            return await asyncio.shield(hit[1])
+
+        fut = asyncio.get_running_loop().create_future()
+        self._cache[key] = (now, fut)
+        data = None
         try:
-            await asyncio.sleep(random.uniform(0.02, 0.08))
-            async with self.session.get(url, params=params, proxy=proxy) as resp:
-                if resp.status == 200:
-                    return await resp.json()
-        except Exception:
-            return None
+            data = await self._fetch(url, params)
+        finally:
+            if not fut.done():
+                fut.set_result(data)
+            if data is None and self._cache.get(key, (0, None))[1] is fut:
+                del self._cache[key]
+        return data
+
+    async def _fetch(self, url, params):
+        host = urlsplit(url).hostname
+        for attempt in range(self.max_retries + 1):
+            proxy = self.proxy_manager.get_random_proxy() if self.proxy_manager else None
+            try:
+                async with self._host_sem[host], self._host_limiter[host]:
+                    async with self.session.get(url, params=params, proxy=proxy, timeout=self.timeout) as resp:
+                        if resp.status == 200:
+                            raw = await resp.read()
+                            if resp.charset and resp.charset.lower() not in ('utf-8', 'utf8'):
+                                raw = raw.decode(resp.charset, errors='replace')
+                            return orjson.loads(raw)
+                        if resp.status not in (429, 503):
+                            return None
+                        delay = self._retry_delay(resp.headers, attempt)
+            except aiohttp.ClientConnectionError:
+                delay = self._retry_delay({}, attempt)
+            except Exception:
+                return None
+            if attempt < self.max_retries:
+                await asyncio.sleep(delay)
+        return None
 
-    async def google_enhanced(self, kw: str) -> Set[str]:
-        if not self.enabled_engines.get("google", False):
-            return set()
-        
-        results = set()
-        base_url = "http://suggestqueries.google.com/complete/search"
-        
-        clients = ['chrome', 'firefox', 'safari', 'toolbar']
-        for client in clients:
-            data = await self._get(base_url, {'client': client, 'q': kw, 'hl': 'de'})
-            if data and len(data) > 1:
-                results.update(data[1][:8])
-        
-        for char in 'abcdefghijklmnopqrstuvwxyz0123456789':
-            expanded_kw = f"{kw} {char}"
-            data = await self._get(base_url, {'client': 'chrome', 'q': expanded_kw, 'hl': 'de'})
-            if data and len(data) > 1:
-                results.update(data[1][:5])
-        
-        return results
-
-    async def bing_enhanced(self, kw: str) -> Set[str]:
-        if not self.enabled_engines.get("bing", False):
-            return set()
-            
-        results = set()
-        base_url = "https://api.bing.com/osjson.aspx"
-        
-        data = await self._get(base_url, {'query': kw})
-        if data and len(data) > 1:
-            results.update(data[1][:8])
-        
-        for char in 'abcdefghijklmnopqrstuvwxyz0123456789':
-            expanded = f"{kw} {char}"
-            data = await self._get(base_url, {'query': expanded})
-            if data and len(data) > 1:
-                results.update(data[1][:4])
-        
-        return results
-
-    async def duckduckgo_enhanced(self, kw: str) -> Set[str]:
-        if not self.enabled_engines.get("duckduckgo", False):
-            return set()
-            
-        results = set()
-        base_url = "https://duckduckgo.com/ac/"
-        
-        data = await self._get(base_url, {'q': kw, 'type': 'list'})
-        if data:
-            results.update(item['phrase'] for item in data if 'phrase' in item)
-        
-        for char in 'abcdefghijklmnopqrstu':
-            data = await self._get(base_url, {'q': f"{kw} {char}", 'type': 'list'})
-            if data:
-                results.update(item['phrase'] for item in data[:3] if 'phrase' in item)
-        
-        return results
-
-    async def youtube_suggestions(self, kw: str) -> Set[str]:
-        if not self.enabled_engines.get("youtube", False):
-            return set()
-            
-        results = set()
-        base_url = "http://suggestqueries.google.com/complete/search"
-        
-        data = await self._get(base_url, {'client': 'youtube', 'ds': 'yt', 'q': kw})
-        if data and len(data) > 1:
-            results.update(data[1][:6])
-        
-        return results
-
-    async def amazon_suggestions(self, kw: str) -> Set[str]:
-        if not self.enabled_engines.get("amazon", False):
-            return set()
-            
-        results = set()
-        base_url = "http://suggestqueries.google.com/complete/search"
-        amazon_kw = f"{kw} amazon"
-        data = await self._get(base_url, {'client': 'chrome', 'q': amazon_kw, 'hl': 'de'})
-        if data and len(data) > 1:
-            clean_results = [item.replace(' amazon', '').strip() for item in data[1][:4]]
-            results.update(clean_results)
-        
-        return results
+    @staticmethod
+    def _retry_delay(headers, attempt: int) -> float:
+        backoff = 0.5 * 2 ** attempt + random.uniform(0, 0.25)
+        if headers.get('X-RateLimit-Remaining') == '0' and headers.get('X-RateLimit-Reset'):
+            wait = headers['X-RateLimit-Reset']
+        else:
+            wait = headers.get('Retry-After')
+        try:
+            wait = float(wait)
+        except (TypeError, ValueError):
+            return backoff
+        if wait > 1e9:
+            wait -= time.time()
+        return min(max(wait, backoff), 30.0)
+
+    def _plan(self, kw: str, expansions: List[str]) -> List[tuple]:
+        plan = []
+        google_url = "http://suggestqueries.google.com/complete/search"
+
+        if self.enabled_engines.get("google", False):
+            for client in ['chrome', 'firefox', 'safari', 'toolbar']:
+                plan.append(('google', google_url, {'client': client, 'q': kw, 'hl': 'de'}, 8))
+            plan.extend(('google', google_url, {'client': 'chrome', 'q': q, 'hl': 'de'}, 5) for q in expansions)
+
+        if self.enabled_engines.get("bing", False):
+            bing_url = "https://api.bing.com/osjson.aspx"
+            plan.append(('bing', bing_url, {'query': kw}, 8))
+            plan.extend(('bing', bing_url, {'query': q}, 4) for q in expansions)
+
+        if self.enabled_engines.get("duckduckgo", False):
+            ddg_url = "https://duckduckgo.com/ac/"
+            plan.append(('duckduckgo', ddg_url, {'q': kw, 'type': 'list'}, None))
+            plan.extend(('duckduckgo', ddg_url, {'q': q, 'type': 'list'}, 3) for q in expansions[:21])
+
+        if self.enabled_engines.get("youtube", False):
+            plan.append(('youtube', google_url, {'client': 'youtube', 'ds': 'yt', 'q': kw}, 6))
+
+        if self.enabled_engines.get("amazon", False):
+            plan.append(('amazon', google_url, {'client': 'chrome', 'q': f"{kw} amazon", 'hl': 'de'}, 4))
+
+        return plan
+
+    @staticmethod
+    def _parse(tag: str, data, limit: Optional[int]) -> List[str]:
+        if not isinstance(data, list):
+            return []
+        if tag == 'duckduckgo':
+            return [item['phrase'] for item in data[:limit] if isinstance(item, dict) and 'phrase' in item]
+        if len(data) < 2 or not isinstance(data[1], list):
+            return []
+        items = [item for item in data[1][:limit] if isinstance(item, str)]
+        if tag == 'amazon':
+            return [item.replace(' amazon', '') for item in items]
+        return items
 
     async def scrape_all_enhanced(self, kw: str) -> Set[str]:
-        tasks = [
-            self.google_enhanced(kw),
-            self.bing_enhanced(kw),
-            self.duckduckgo_enhanced(kw),
-            self.youtube_suggestions(kw),
-            self.amazon_suggestions(kw)
-        ]
-        
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        expansions = [f"{kw} {c}" for c in _EXPANSION]
+        plan = self._plan(kw, expansions)
+        unique = {}
+        for _, url, params, _ in plan:
+            unique.setdefault((url, frozenset(params.items())), (url, params))
+
+        results = await asyncio.gather(*(self._get(u, p) for u, p in unique.values()), return_exceptions=True)
+        responses = dict(zip(unique, results))
         all_suggestions = set()
-        
-        for result in results:
-            if isinstance(result, set):
-                all_suggestions.update(result)
-        
-        return {s for s in all_suggestions if 2 <= len(s) <= 100 and s.strip()}
+
+        for tag, url, params, limit in plan:
+            data = responses[(url, frozenset(params.items()))]
+            all_suggestions.update(filter(None, map(_accept, self._parse(tag, data, limit))))
+
+        return all_suggestions
 
     async def batch(self, kws: List[str], progress_cb=None) -> Set[str]:
         sem = asyncio.Semaphore(self.max_concurrent)
         all_sug = set()
         done, total = 0, len(kws)
+        report = _throttled(progress_cb) if progress_cb else None
 
         async def run_one(k):
             nonlocal done
             async with sem:
                 s = await self.scrape_all_enhanced(k)
                 done += 1
-                if progress_cb:
-                    progress_cb(int(done*100/total))
+                if report:
+                    report(done, total)
                 return s
 
         tasks = [run_one(k.strip()) for k in kws if k.strip()]
@@ -248,52 +349,91 @@ class EnhancedKeywordScraper:
         return all_sug
 
 
-class FastProxyThread(QThread):
+class LoopThread(QThread):
+    def __init__(self):
+        super().__init__()
+        self.loop = _new_event_loop()
+
+    def run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, coro) -> Future:
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def shutdown(self, app_session: AppSession):
+        if self.isRunning():
+            try:
+                self.submit(self._drain(app_session)).result(timeout=5)
+            except Exception:
+                pass
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.wait()
+        self.loop.close()
+
+    async def _drain(self, app_session: AppSession):
+        tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        for t in tasks:
+            t.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await app_session.close()
+
+
+class LoopTask(QObject):
     progress = Signal(int)
-    finished = Signal(int, int)
     error = Signal(str)
 
-    def __init__(self, manager: ProxyManager, proxy_list: List[str]):
+    def __init__(self, loop_thread: LoopThread):
         super().__init__()
-        self.manager = manager
-        self.proxy_list = proxy_list
+        self.loop_thread = loop_thread
 
-    def run(self):
+    def start(self):
+        self.loop_thread.submit(self._work()).add_done_callback(self._done)
+
+    def _done(self, fut: Future):
+        if fut.cancelled():
+            return
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            ok, bad = loop.run_until_complete(self.manager.fast_import_and_check(self.proxy_list, self.progress.emit))
-            loop.close()
-            self.finished.emit(ok, bad)
+            result = fut.result()
         except Exception as e:
             self.error.emit(str(e))
+        else:
+            self._finish(result)
 
 
-class EnhancedScrapeThread(QThread):
-    progress = Signal(int)
-    finished = Signal(set)
-    error = Signal(str)
+class FastProxyTask(LoopTask):
+    finished = Signal(int, int)
 
-    def __init__(self, kws: List[str], threads: int, enabled_engines: dict, manager: Optional[ProxyManager]):
-        super().__init__()
+    def __init__(self, loop_thread: LoopThread, manager: ProxyManager, proxy_list: List[str]):
+        super().__init__(loop_thread)
+        self.manager = manager
+        self.proxy_list = proxy_list
+
+    async def _work(self):
+        return await self.manager.fast_import_and_check(self.proxy_list, self.progress.emit)
+
+    def _finish(self, result):
+        self.finished.emit(*result)
+
+
+class EnhancedScrapeTask(LoopTask):
+    finished = Signal(list)
+
+    def __init__(self, loop_thread: LoopThread, kws: List[str], threads: int, enabled_engines: dict, manager: Optional[ProxyManager], app_session: AppSession):
+        super().__init__(loop_thread)
+        self.app_session = app_session
         self.kws = kws
         self.threads = threads
         self.enabled_engines = enabled_engines
         self.manager = manager
 
-    def run(self):
-        try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            result = loop.run_until_complete(self._work())
-            loop.close()
-            self.finished.emit(result)
-        except Exception as e:
-            self.error.emit(str(e))
-
     async def _work(self):
-        async with EnhancedKeywordScraper(self.threads, enabled_engines=self.enabled_engines, proxy_manager=self.manager) as s:
-            return await s.batch(self.kws, self.progress.emit)
+        async with EnhancedKeywordScraper(self.threads, enabled_engines=self.enabled_engines, proxy_manager=self.manager, app_session=self.app_session) as s:
+            result = await s.batch(self.kws, self.progress.emit)
+        return await asyncio.get_running_loop().run_in_executor(None, sorted, result)
+
+    def _finish(self, result):
+        self.finished.emit(result)
 
 
 class KeywordScraperGUI(QMainWindow):
@@ -302,10 +442,13 @@ class KeywordScraperGUI(QMainWindow):
         self.setWindowTitle("Website Keyword Scraper v2")
         self.setFixedSize(800, 650)
 
-        self.proxy_manager = ProxyManager()
-        self.scrape_thread = None
-        self.proxy_thread = None
-        self.generated = set()
+        self.app_session = AppSession()
+        self.proxy_manager = ProxyManager(self.app_session)
+        self.scrape_task = None
+        self.proxy_task = None
+        self.loop_thread = LoopThread()
+        self.loop_thread.start()
+        self.generated = []
 
         self._build_ui()
         self._apply_style()
@@ -446,7 +589,7 @@ class KeywordScraperGUI(QMainWindow):
         self.proxy_stats = QLabel("0 tested, 0 working, 0 failed")
         self.proxy_stats.setAlignment(Qt.AlignmentFlag.AlignCenter)
         proxy_results_layout.addWidget(self.proxy_stats)
-        self.proxy_list = QTextEdit()
+        self.proxy_list = QPlainTextEdit()
         self.proxy_list.setReadOnly(True)
         self.proxy_list.setMaximumHeight(120)
         proxy_results_layout.addWidget(self.proxy_list)
@@ -466,7 +609,7 @@ class KeywordScraperGUI(QMainWindow):
         results_header.addWidget(self.count_label)
         results_layout.addLayout(results_header)
 
-        self.results_text = QTextEdit()
+        self.results_text = QPlainTextEdit()
         self.results_text.setReadOnly(True)
         self.results_text.setPlaceholderText("Enhanced results from selected engines will appear here...")
         results_layout.addWidget(self.results_text)
@@ -485,8 +628,8 @@ class KeywordScraperGUI(QMainWindow):
             QMainWindow { background: #F5F5F5; color: #333; }
             QGroupBox { font-weight: 600; border: 1px solid #CCC; border-radius: 5px; margin-top: 6px; padding-top: 10px; }
             QGroupBox::title { subcontrol-origin: margin; left: 10px; padding: 0 5px 0 5px; }
-            QTextEdit, QSpinBox, QComboBox { border: 1px solid #CCC; border-radius: 4px; padding: 5px; background: white; }
-            QTextEdit:focus, QSpinBox:focus, QComboBox:focus { border: 2px solid #4CAF50; }
+            QTextEdit, QPlainTextEdit, QSpinBox, QComboBox { border: 1px solid #CCC; border-radius: 4px; padding: 5px; background: white; }
+            QTextEdit:focus, QPlainTextEdit:focus, QSpinBox:focus, QComboBox:focus { border: 2px solid #4CAF50; }
             QPushButton { background: #4CAF50; color: white; border: none; border-radius: 4px; padding: 8px 16px; font-weight: 600; }
             QPushButton:hover { background: #45a049; }
             QPushButton:disabled { background: #CCC; color: #666; }
@@ -534,16 +677,17 @@ class KeywordScraperGUI(QMainWindow):
         self.scrape_progress.setValue(0)
         self.status.setText("Scraping...")
 
-        self.scrape_thread = EnhancedScrapeThread(kws, self.threads_spin.value(), enabled_engines, manager)
-        self.scrape_thread.progress.connect(self.scrape_progress.setValue)
-        self.scrape_thread.finished.connect(self._scrape_done)
-        self.scrape_thread.error.connect(self._scrape_err)
-        self.scrape_thread.start()
+        self.scrape_task = EnhancedScrapeTask(self.loop_thread, kws, self.threads_spin.value(), enabled_engines, manager, self.app_session)
+        self.scrape_task.progress.connect(self.scrape_progress.setValue)
+        self.scrape_task.finished.connect(self._scrape_done)
+        self.scrape_task.error.connect(self._scrape_err)
+        self.scrape_task.start()
 
-    def _scrape_done(self, suggestions: set):
-        self.generated = suggestions
-        out = sorted(set(suggestions))
+    def _scrape_done(self, suggestions: list):
+        self.generated = out = suggestions
+        self.results_text.setUpdatesEnabled(False)
         self.results_text.setPlainText("\n".join(out))
+        self.results_text.setUpdatesEnabled(True)
         self.count_label.setText(str(len(out)))
         self.export_btn.setEnabled(len(out) > 0)
         self.start_btn.setEnabled(True)
@@ -573,16 +717,19 @@ class KeywordScraperGUI(QMainWindow):
         path, _ = QFileDialog.getSaveFileName(self, "Export Results", f"SiteKeywords_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt", "Text (*.txt);;CSV (*.csv)")
         if not path:
             return
-        data = sorted(set(self.generated))
+        data = self.generated
+        is_csv = path.endswith(".csv")
+        # csv needs untranslated output; write its header with the platform line ending instead
+        eol = os.linesep if is_csv else "\n"
         try:
-            with open(path, "w", encoding="utf-8") as f:
-                f.write("# Website Keyword Scraper v2\n")
-                f.write(f"# Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"# Total keywords: {len(data)}\n\n")
-                if path.endswith(".csv"):
-                    f.write("keyword\n")
-                    for k in data:
-                        f.write(f'"{k}"\n')
+            with open(path, "w", encoding="utf-8", newline="" if is_csv else None, buffering=1 << 20) as f:
+                f.write(f"# Website Keyword Scraper v2{eol}")
+                f.write(f"# Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}{eol}")
+                f.write(f"# Total keywords: {len(data)}{eol}{eol}")
+                if is_csv:
+                    w = csv.writer(f, lineterminator=os.linesep)
+                    w.writerow(["keyword"])
+                    w.writerows([k] for k in data)
                 else:
                     f.write("\n".join(data))
             QMessageBox.information(self, "Export Success", f"Saved {len(data)} keywords!")
@@ -623,24 +770,20 @@ class KeywordScraperGUI(QMainWindow):
         self.proxy_progress.setValue(0)
         self.status.setText(f"Testing {len(proxies)} proxies...")
 
-        self.proxy_thread = FastProxyThread(self.proxy_manager, proxies)
-        self.proxy_thread.progress.connect(self.proxy_progress.setValue)
-        self.proxy_thread.finished.connect(self._proxy_done)
-        self.proxy_thread.error.connect(self._proxy_err)
-        self.proxy_thread.start()
+        self.proxy_task = FastProxyTask(self.loop_thread, self.proxy_manager, proxies)
+        self.proxy_task.progress.connect(self.proxy_progress.setValue)
+        self.proxy_task.finished.connect(self._proxy_done)
+        self.proxy_task.error.connect(self._proxy_err)
+        self.proxy_task.start()
 
     def _proxy_done(self, ok: int, bad: int):
         self.test_proxies_btn.setEnabled(True)
         self.proxy_progress.setVisible(False)
         self.status.setText("Ready")
 
-        work = sorted(self.proxy_manager.working_proxies, key=lambda x: x.get('response_time', 9e9))
-        lines = []
-        for i, info in enumerate(work, 1):
-            rt = info.get('response_time', 0)
-            speed_label = "FAST" if rt < 1 else "GOOD" if rt < 3 else "OK"
-            lines.append(f"{i}. {info['proxy']} ({rt:.2f}s {speed_label})")
-        
+        work = sorted(self.proxy_manager.working_proxies, key=itemgetter('response_time'))
+        lines = [f"{i}. {w['proxy']} ({w['response_time']:.2f}s {_label(w['response_time'])})" for i, w in enumerate(work, 1)]
+
         self.proxy_list.setPlainText("\n".join(lines) if lines else "No working proxies.")
         self.proxy_stats.setText(f"{ok+bad} tested, {ok} working, {bad} failed")
         self.proxy_input.clear()
@@ -660,6 +803,10 @@ class KeywordScraperGUI(QMainWindow):
         self.proxy_stats.setText("0 tested, 0 working, 0 failed")
         self.status.setText("Ready")
 
+    def closeEvent(self, event):
+        self.loop_thread.shutdown(self.app_session)
+        super().closeEvent(event)
+
 
 def main():
     app = QApplication(sys.argv)